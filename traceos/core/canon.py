@@ -225,6 +225,21 @@ TRACEOS_CANON: tuple[CanonicalSubsystem, ...] = (
 )
 
 
+# =============================================================================
+# LOOKUP INDEXES
+# =============================================================================
+# Built once at import so lookups are a single dict hit instead of a scan.
+# =============================================================================
+
+_BY_BIOLOGICAL_NAME: dict[str, CanonicalSubsystem] = {
+    subsystem.biological_name.lower(): subsystem for subsystem in TRACEOS_CANON
+}
+
+_BY_SYSTEM_NAME: dict[str, CanonicalSubsystem] = {
+    subsystem.system_name.lower(): subsystem for subsystem in TRACEOS_CANON
+}
+
+
 # =============================================================================
 # LOOKUP FUNCTIONS
 # =============================================================================
@@ -236,11 +251,7 @@ def get_subsystem_by_biological_name(name: str) -> Optional[CanonicalSubsystem]:
 
     Case-insensitive matching.
     """
-    name_lower = name.lower()
-    for subsystem in TRACEOS_CANON:
-        if subsystem.biological_name.lower() == name_lower:
-            return subsystem
-    return None
+    return _BY_BIOLOGICAL_NAME.get(name.lower())
 
 
 def get_subsystem_by_system_name(name: str) -> Optional[CanonicalSubsystem]:
@@ -249,8 +260,4 @@ def get_subsystem_by_system_name(name: str) -> Optional[CanonicalSubsystem]:
 
     Case-insensitive matching.
     """
-    name_lower = name.lower()
-    for subsystem in TRACEOS_CANON:
-        if subsystem.system_name.lower() == name_lower:
-            return subsystem
-    return None
+    return _BY_SYSTEM_NAME.get(name.lower())
@@ -19,6 +19,8 @@ Patent Pending: US Provisional 63/926,510
 
 from typing import Any, List, Tuple
 
+import numpy as np
+
 from traceos.sparks.base import SparkBase
 from traceos.sparks.schemas import SparkMetadata, SparkResponse
 from traceos.protocol.schemas import DeriveOutput
@@ -91,16 +93,12 @@ class HandsSpark(SparkBase):
         if len(points) < 3:
             return points
 
-        # Simple 3-point moving average smoothing
-        smoothed = [points[0]]
-        for i in range(1, len(points) - 1):
-            x = (points[i-1][0] + points[i][0] + points[i+1][0]) / 3
-            y = (points[i-1][1] + points[i][1] + points[i+1][1]) / 3
-            p = (points[i-1][2] + points[i][2] + points[i+1][2]) / 3
-            smoothed.append((x, y, p))
-        smoothed.append(points[-1])
+        # Simple 3-point moving average smoothing, computed for all
+        # interior points at once over an (N, 3) array
+        arr = np.asarray(points, dtype=np.float64)
+        interior = (arr[:-2] + arr[1:-1] + arr[2:]) / 3
 
-        return smoothed
+        return [points[0], *map(tuple, interior.tolist()), points[-1]]
 
     async def plan_stroke(
         self,
@@ -28,12 +28,14 @@ class SparkRegistry:
         if cls._instance is None:
             cls._instance = super().__new__(cls)
             cls._instance._sparks = {}
+            cls._instance._sparks_by_id = {}
             cls._instance._initialized = False
         return cls._instance
 
     def __init__(self) -> None:
         if not self._initialized:
             self._sparks: dict[str, SparkBase] = {}
+            self._sparks_by_id: dict[UUID, SparkBase] = {}
             self._initialized = True
 
     def register(self, name: str, spark: SparkBase) -> None:
@@ -47,6 +49,7 @@ class SparkRegistry:
         if name in self._sparks:
             raise ValueError(f"Spark '{name}' already registered")
         self._sparks[name] = spark
+        self._sparks_by_id.setdefault(spark.metadata.id, spark)
 
     def get(self, name: str) -> Optional[SparkBase]:
         """
@@ -70,10 +73,7 @@ class SparkRegistry:
         Returns:
             SparkBase instance or None if not found.
         """
-        for spark in self._sparks.values():
-            if spark.metadata.id == spark_id:
-                return spark
-        return None
+        return self._sparks_by_id.get(spark_id)
 
     def all_sparks(self) -> list[SparkBase]:
         """Get all registered Sparks."""
@@ -94,10 +94,17 @@ class SparkRegistry:
             True if Spark was removed, False if not found.
         """
         if name in self._sparks:
-            del self._sparks[name]
+            spark_id = self._sparks.pop(name).metadata.id
+            self._sparks_by_id.pop(spark_id, None)
+            # Re-point the id index at any Spark still registered under it
+            for spark in self._sparks.values():
+                if spark.metadata.id == spark_id:
+                    self._sparks_by_id[spark_id] = spark
+                    break
             return True
         return False
 
     def clear(self) -> None:
         """Remove all registered Sparks."""
         self._sparks.clear()
+        self._sparks_by_id.clear()